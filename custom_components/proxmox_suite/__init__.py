@@ -1,42 +1,99 @@
 from __future__ import annotations
 
+import aiohttp
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.helpers import device_registry as dr
 
-from .const import DOMAIN, PLATFORMS
+from .api import REQUEST_TIMEOUT, build_ssl_context
+from .const import CONF_HOST, CONF_PORT, CONF_VERIFY_SSL, DOMAIN, KEEPALIVE_TIMEOUT_SECONDS, PLATFORMS
 from .coordinator import ProxmoxCoordinator
 
 
+# hass.data[DOMAIN] key of the connectors shared between entries
+_CONNECTORS = "_connectors"
+
+
+def _connector_key(entry: ConfigEntry) -> tuple[str, int, bool]:
+    # Several PVE entries (one per node) may point at the same host:port
+    return entry.data[CONF_HOST], entry.data[CONF_PORT], entry.data[CONF_VERIFY_SSL]
+
+
+def _create_session(hass: HomeAssistant, entry: ConfigEntry) -> aiohttp.ClientSession:
+    """Create a session on the host's shared connector so TLS connections stay alive between polls."""
+    # (host, port, verify_ssl) -> (connector, entry_ids using it)
+    connectors = hass.data.setdefault(DOMAIN, {}).setdefault(_CONNECTORS, {})
+
+    key = _connector_key(entry)
+    shared = connectors.get(key)
+    if shared is None or shared[0].closed:
+        ssl_ctx = build_ssl_context(entry.data[CONF_VERIFY_SSL])
+        connector = aiohttp.TCPConnector(
+            limit=16, limit_per_host=16, keepalive_timeout=KEEPALIVE_TIMEOUT_SECONDS, ssl=ssl_ctx
+        )
+        shared = connectors[key] = (connector, set())
+
+    connector, users = shared
+    users.add(entry.entry_id)
+    return aiohttp.ClientSession(connector=connector, connector_owner=False, timeout=REQUEST_TIMEOUT)
+
+
+async def _async_close_session(hass: HomeAssistant, entry: ConfigEntry, session: aiohttp.ClientSession) -> None:
+    """Close the entry's session and the shared connector once its last user is gone."""
+    await session.close()
+
+    connectors = hass.data[DOMAIN][_CONNECTORS]
+    key = _connector_key(entry)
+    shared = connectors.get(key)
+    if shared is None:
+        return
+
+    connector, users = shared
+    users.discard(entry.entry_id)
+    if not users:
+        del connectors[key]
+        await connector.close()
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    coordinator = ProxmoxCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    session = _create_session(hass, entry)
+    coordinator = ProxmoxCoordinator(hass, entry, session)
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        await _async_close_session(hass, entry, session)
+        raise
+
+    # Entries are not unloaded on shutdown -> close the session when HA stops
+    async def _async_on_close(_event: Event) -> None:
+        await _async_close_session(hass, entry, session)
+
+    entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_on_close))
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     # ✅ Title in "Geräte & Dienste" ohne IP
-    display = coordinator.display_name or ("PVE" if coordinator.backend == "pve" else "PBS")
-    new_title = f"Proxmox {coordinator.backend.upper()} ({display})"
+    new_title = coordinator.device_name
     if entry.title != new_title:
         hass.config_entries.async_update_entry(entry, title=new_title)
 
     # ✅ Device Registry Name ohne IP
     dev_reg = dr.async_get(hass)
-    model = "Proxmox VE" if coordinator.backend == "pve" else "Proxmox Backup Server"
-    device_name = f"Proxmox {coordinator.backend.upper()} ({display})"
-
     device = dev_reg.async_get_or_create(
         config_entry_id=entry.entry_id,
-        identifiers={(DOMAIN, coordinator.device_identifier)},
-        name=device_name,
+        identifiers=coordinator.device_identifiers,
+        name=new_title,
         manufacturer="Proxmox",
-        model=model,
+        model=coordinator.model_name,
     )
 
     # Optional: software version
     ver = None
-    vdata = (coordinator.data or {}).get("version")
+    # data is always set after a successful first refresh
+    vdata = coordinator.data.get("version")
     if isinstance(vdata, dict):
         ver = vdata.get("version") or vdata.get("release")
     elif isinstance(vdata, str):
@@ -52,5 +109,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        coordinator: ProxmoxCoordinator | None = hass.data[DOMAIN].pop(entry.entry_id, None)
+        if coordinator is not None:
+            await _async_close_session(hass, entry, coordinator.api.session)
     return unload_ok
\ No newline at end of file
@@ -1,32 +1,69 @@
 from __future__ import annotations
 
+import asyncio
+import ssl
 from dataclasses import dataclass
 from typing import Any, Optional
 
 import aiohttp
+import orjson
+from yarl import URL
+
+from homeassistant.util.ssl import client_context
+
+from .const import BACKEND_PVE
+
+
+# Fail fast on dead peers: connect/TLS handshake is short, whole request max 20 s
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=20, connect=5, sock_connect=5, sock_read=15)
 
 
 class ProxmoxApiError(Exception):
     pass
 
 
-@dataclass
+def build_base_url(host: str, port: int) -> str:
+    return f"https://{host}:{port}/api2/json"
+
+
+def build_auth_headers(backend: str, token_id: str, token_secret: str) -> dict[str, str]:
+    if backend == BACKEND_PVE:
+        return {"Authorization": f"PVEAPIToken={token_id}={token_secret}"}
+    return {"Authorization": f"PBSAPIToken {token_id}:{token_secret}"}
+
+
+def build_ssl_context(verify_ssl: bool) -> ssl.SSLContext | bool:
+    """Return the ssl argument for aiohttp; False erlaubt self-signed.
+
+    client_context() is cached by Home Assistant, so the CA bundle is loaded only once.
+    """
+    return client_context() if verify_ssl else False
+
+
+@dataclass(slots=True, frozen=True)
 class ProxmoxAPI:
     base_url: str
     headers: dict[str, str]
     session: aiohttp.ClientSession
-    verify_ssl: bool
-
-    async def get(self, path: str, params: Optional[dict[str, Any]] = None) -> Any:
-        url = f"{self.base_url}{path}"
-        ssl = self.verify_ssl  # bool; False erlaubt self-signed
+    ssl_context: ssl.SSLContext | bool
+    timeout: aiohttp.ClientTimeout = REQUEST_TIMEOUT
 
+    async def get(
+        self, path: str, params: Optional[dict[str, Any]] = None, *, url: Optional[str | URL] = None
+    ) -> Any:
+        """GET an API path; pass a precomputed full ``url`` (ideally a yarl URL) to skip building it."""
+        if url is None:
+            url = f"{self.base_url}{path}"
         try:
-            async with self.session.get(url, headers=self.headers, params=params, ssl=ssl, timeout=20) as resp:
+            async with self.session.get(
+                url, headers=self.headers, params=params, ssl=self.ssl_context, timeout=self.timeout
+            ) as resp:
                 if resp.status >= 400:
                     text = await resp.text()
                     raise ProxmoxApiError(f"HTTP {resp.status} for {path}: {text}")
-                payload = await resp.json(content_type=None)
+                payload = orjson.loads(await resp.read())
                 return payload.get("data")
         except aiohttp.ClientError as e:
-            raise ProxmoxApiError(str(e)) from e
\ No newline at end of file
+            raise ProxmoxApiError(str(e)) from e
+        except asyncio.TimeoutError as e:
+            raise ProxmoxApiError(f"Timeout for {path}") from e
\ No newline at end of file
@@ -6,7 +6,7 @@ from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .api import ProxmoxAPI, ProxmoxApiError
+from .api import ProxmoxAPI, ProxmoxApiError, build_auth_headers, build_base_url, build_ssl_context
 from .const import (
     DOMAIN,
     CONF_BACKEND,
@@ -24,20 +24,44 @@ from .const import (
 )
 
 
+_USER_SCHEMA = vol.Schema(
+    {vol.Required(CONF_BACKEND, default=BACKEND_PVE): vol.In([BACKEND_PVE, BACKEND_PBS])}
+)
+
+
+def _connection_schema(default_port: int, default_node: str) -> vol.Schema:
+    return vol.Schema(
+        {
+            vol.Required(CONF_HOST): str,
+            vol.Required(CONF_PORT, default=default_port): int,
+            vol.Required(CONF_TOKEN_ID): str,
+            vol.Required(CONF_TOKEN_SECRET): str,
+            vol.Optional(CONF_NODE, default=default_node): str,
+            vol.Required(CONF_VERIFY_SSL, default=DEFAULT_VERIFY_SSL): bool,
+        }
+    )
+
+
+# Built once at import; user input is re-applied as suggested values after an error
+_CONNECTION_SCHEMAS = {
+    BACKEND_PVE: _connection_schema(DEFAULT_PVE_PORT, ""),
+    BACKEND_PBS: _connection_schema(DEFAULT_PBS_PORT, "localhost"),
+}
+
+
 async def _validate(hass: HomeAssistant, data: dict) -> dict:
-    base_url = f"https://{data[CONF_HOST]}:{data[CONF_PORT]}/api2/json"
+    base_url = build_base_url(data[CONF_HOST], data[CONF_PORT])
     session = async_get_clientsession(hass)
 
     backend = data[CONF_BACKEND]
-    token_id = data[CONF_TOKEN_ID]
-    token_secret = data[CONF_TOKEN_SECRET]
+    headers = build_auth_headers(backend, data[CONF_TOKEN_ID], data[CONF_TOKEN_SECRET])
 
-    if backend == BACKEND_PVE:
-        headers = {"Authorization": f"PVEAPIToken={token_id}={token_secret}"}
-    else:
-        headers = {"Authorization": f"PBSAPIToken {token_id}:{token_secret}"}
-
-    api = ProxmoxAPI(base_url=base_url, headers=headers, session=session, verify_ssl=data[CONF_VERIFY_SSL])
+    api = ProxmoxAPI(
+        base_url=base_url,
+        headers=headers,
+        session=session,
+        ssl_context=build_ssl_context(data[CONF_VERIFY_SSL]),
+    )
 
     # minimal check
     if backend == BACKEND_PVE:
@@ -60,10 +84,7 @@ class ProxmoxSuiteConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def async_step_user(self, user_input=None):
         if user_input is None:
-            schema = vol.Schema(
-                {vol.Required(CONF_BACKEND, default=BACKEND_PVE): vol.In([BACKEND_PVE, BACKEND_PBS])}
-            )
-            return self.async_show_form(step_id="user", data_schema=schema)
+            return self.async_show_form(step_id="user", data_schema=_USER_SCHEMA)
 
         self._backend = user_input[CONF_BACKEND]
         return await self.async_step_connection()
@@ -71,21 +92,9 @@ class ProxmoxSuiteConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def async_step_connection(self, user_input=None):
         errors = {}
         backend = getattr(self, "_backend", BACKEND_PVE)
-
-        default_port = DEFAULT_PVE_PORT if backend == BACKEND_PVE else DEFAULT_PBS_PORT
-        default_node = "" if backend == BACKEND_PVE else "localhost"
+        schema = _CONNECTION_SCHEMAS[backend]
 
         if user_input is None:
-            schema = vol.Schema(
-                {
-                    vol.Required(CONF_HOST): str,
-                    vol.Required(CONF_PORT, default=default_port): int,
-                    vol.Required(CONF_TOKEN_ID): str,
-                    vol.Required(CONF_TOKEN_SECRET): str,
-                    vol.Optional(CONF_NODE, default=default_node): str,
-                    vol.Required(CONF_VERIFY_SSL, default=DEFAULT_VERIFY_SSL): bool,
-                }
-            )
             return self.async_show_form(step_id="connection", data_schema=schema, errors=errors)
 
         # attach backend
@@ -96,17 +105,11 @@ class ProxmoxSuiteConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             validated = await _validate(self.hass, data)
         except Exception:
             errors["base"] = "cannot_connect"
-            schema = vol.Schema(
-                {
-                    vol.Required(CONF_HOST, default=user_input[CONF_HOST]): str,
-                    vol.Required(CONF_PORT, default=user_input[CONF_PORT]): int,
-                    vol.Required(CONF_TOKEN_ID, default=user_input[CONF_TOKEN_ID]): str,
-                    vol.Required(CONF_TOKEN_SECRET, default=user_input[CONF_TOKEN_SECRET]): str,
-                    vol.Optional(CONF_NODE, default=user_input.get(CONF_NODE, default_node)): str,
-                    vol.Required(CONF_VERIFY_SSL, default=user_input[CONF_VERIFY_SSL]): bool,
-                }
+            return self.async_show_form(
+                step_id="connection",
+                data_schema=self.add_suggested_values_to_schema(schema, user_input),
+                errors=errors,
             )
-            return self.async_show_form(step_id="connection", data_schema=schema, errors=errors)
 
         node = validated["node"]
         data[CONF_NODE] = node
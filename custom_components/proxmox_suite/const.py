@@ -16,5 +16,11 @@ DEFAULT_PBS_PORT = 8007
 
 DEFAULT_VERIFY_SSL = False
 UPDATE_INTERVAL_SECONDS = 30
+# Adaptive polling: double the interval after this many unchanged cycles, up to the max
+UPDATE_INTERVAL_MAX_SECONDS = 60
+# Pooled connections must outlive the slowest poll, otherwise every poll pays a new TLS handshake
+KEEPALIVE_TIMEOUT_SECONDS = UPDATE_INTERVAL_MAX_SECONDS + 15
+STABLE_CYCLES_BEFORE_BACKOFF = 5
+VERSION_CACHE_SECONDS = 3600  # version only changes on upgrades
 
 PLATFORMS = ["sensor"]
\ No newline at end of file
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from datetime import timedelta
-from typing import Any
+from functools import cached_property
+from typing import Any, Awaitable, Callable
+
+import aiohttp
+from yarl import URL
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .api import ProxmoxAPI, ProxmoxApiError
+from .api import ProxmoxAPI, ProxmoxApiError, build_auth_headers, build_base_url, build_ssl_context
 from .const import (
     BACKEND_PBS,
     BACKEND_PVE,
@@ -20,39 +25,126 @@ from .const import (
     CONF_TOKEN_ID,
     CONF_TOKEN_SECRET,
     CONF_VERIFY_SSL,
+    DOMAIN,
+    STABLE_CYCLES_BEFORE_BACKOFF,
+    UPDATE_INTERVAL_MAX_SECONDS,
     UPDATE_INTERVAL_SECONDS,
+    VERSION_CACHE_SECONDS,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Number of most recent tasks kept for the task sensors
+_TASK_HISTORY = 200
+
+# Task fields read by the sensors (and upid/starttime for the history); the rest is dropped
+_TASK_FIELDS = ("upid", "type", "status", "state", "exitstatus", "starttime", "endtime")
+
+
+# Task status values (lower-case) meaning "still running"
+TASK_RUNNING_STATES = frozenset(("running", "active"))
+
+
+# Width of the usage buckets in the polling fingerprint (fraction of the total)
+_USAGE_BUCKET = 0.05
+
+
+def _usage_bucket(used: Any, total: Any) -> int | None:
+    try:
+        return int(float(used) / float(total) / _USAGE_BUCKET)
+    except (TypeError, ValueError, ZeroDivisionError):
+        return None
+
+
+def _usage_fingerprint(data: dict[str, Any]) -> tuple[Any, ...]:
+    """Coarse CPU/memory/load/datastore usage, so moving measurements keep the base interval."""
+    status = data.get("status")
+    if not isinstance(status, dict):
+        status = {}
+    memory = status.get("memory")
+    if not isinstance(memory, dict):
+        memory = {}
+    loadavg = status.get("loadavg")
+    # 1-minute load in steps of 0.5
+    load = _usage_bucket(loadavg[0], 10) if isinstance(loadavg, list) and loadavg else None
+    return (
+        _usage_bucket(status.get("cpu"), 1),
+        _usage_bucket(memory.get("used"), memory.get("total")),
+        load,
+        tuple(
+            _usage_bucket(ds.get("used"), ds.get("total"))
+            for ds in data.get("datastores") or ()
+            if isinstance(ds, dict)
+        ),
+    )
+
+
+def _slim_task(task: dict[str, Any]) -> dict[str, Any]:
+    return {k: task[k] for k in _TASK_FIELDS if k in task}
+
+
+def task_endtime(task: dict[str, Any]) -> float | None:
+    """Return the task's endtime, or None while it has none (missing, empty, 0 or unparseable)."""
+    end = task.get("endtime")
+    # endtime is normally an int from JSON: type check first, float() only as fallback
+    end_type = type(end)
+    if end_type is not int and end_type is not float:
+        if end is None or end == "":
+            return None
+        try:
+            end = float(end)
+        except (TypeError, ValueError):
+            return None
+    return end or None
+
+
+def task_is_running(task: Any) -> bool:
+    """A task is running if its status/state says so or it has not ended yet."""
+    if not isinstance(task, dict):
+        return False
+    status = (task.get("status") or task.get("state") or "").lower()
+    return status in TASK_RUNNING_STATES or task_endtime(task) is None
+
 
 class ProxmoxCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, session: aiohttp.ClientSession) -> None:
+        data = entry.data
         self.entry = entry
-        self.backend = entry.data[CONF_BACKEND]
-        self.host = entry.data[CONF_HOST]
-        self.port = entry.data[CONF_PORT]
-        self.node = entry.data.get(CONF_NODE) or ("localhost" if self.backend == BACKEND_PBS else "")
-        self.verify_ssl = entry.data[CONF_VERIFY_SSL]
-
-        # Stable identifier (do NOT change this for display reasons)
-        self.device_identifier = f"{self.backend}:{self.host}:{self.port}"
+        self.backend = backend = data[CONF_BACKEND]
+        self.host = data[CONF_HOST]
+        self.port = data[CONF_PORT]
+        self.node = data.get(CONF_NODE) or ("localhost" if backend == BACKEND_PBS else "")
+        self.verify_ssl = data[CONF_VERIFY_SSL]
 
         # UI name (never IP)
         self.display_name: str = ""
 
-        token_id = entry.data[CONF_TOKEN_ID]
-        token_secret = entry.data[CONF_TOKEN_SECRET]
+        # Sensor values derived from data, recomputed by the sensor platform on each update
+        self.derived: dict[str, Any] = {}
 
-        base_url = f"https://{self.host}:{self.port}/api2/json"
+        self.api = ProxmoxAPI(
+            base_url=build_base_url(self.host, self.port),
+            headers=self._authorization,
+            session=session,
+            ssl_context=build_ssl_context(self.verify_ssl),
+        )
 
-        if self.backend == BACKEND_PVE:
-            headers = {"Authorization": f"PVEAPIToken={token_id}={token_secret}"}
-        else:
-            headers = {"Authorization": f"PBSAPIToken {token_id}:{token_secret}"}
+        # /version is cached; a failed refresh keeps the stale value
+        self._version_cache: Any = None
+        self._version_expires: float = 0.0
+
+        # PBS task history (upid -> task), refreshed incrementally via "since"
+        self._tasks: dict[str, dict[str, Any]] = {}
 
-        session = async_get_clientsession(hass)
-        self.api = ProxmoxAPI(base_url=base_url, headers=headers, session=session, verify_ssl=self.verify_ssl)
+        # Parsed request URLs per API path; constant once the node is known
+        self._endpoints: dict[str, URL] = {}
+        self._build_endpoints()
+
+        self._do_update = self._build_updater()
+
+        # Adaptive polling state (see _adapt_update_interval)
+        self._fingerprint: tuple[Any, ...] | None = None
+        self._stable_cycles = 0
 
         super().__init__(
             hass=hass,
@@ -61,13 +153,96 @@ class ProxmoxCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             update_interval=timedelta(seconds=UPDATE_INTERVAL_SECONDS),
         )
 
+    @cached_property
+    def device_identifier(self) -> str:
+        """Stable identifier (do NOT change this for display reasons)."""
+        return f"{self.backend}:{self.host}:{self.port}"
+
+    @cached_property
+    def device_identifiers(self) -> frozenset[tuple[str, str]]:
+        """Immutable device registry identifiers, shared by the device and all sensors."""
+        return frozenset({(DOMAIN, self.device_identifier)})
+
+    @cached_property
+    def model_name(self) -> str:
+        return "Proxmox VE" if self.backend == BACKEND_PVE else "Proxmox Backup Server"
+
+    @cached_property
+    def _authorization(self) -> dict[str, str]:
+        data = self.entry.data
+        return build_auth_headers(self.backend, data[CONF_TOKEN_ID], data[CONF_TOKEN_SECRET])
+
+    @property
+    def device_name(self) -> str:
+        """Device/entry title; follows display_name, so it is not cached."""
+        display = self.display_name or ("PVE" if self.backend == BACKEND_PVE else "PBS")
+        return f"Proxmox {self.backend.upper()} ({display})"
+
+    def _build_endpoints(self) -> None:
+        paths = ["/version", "/nodes"]
+        if self.backend == BACKEND_PVE:
+            subs = ("status", "qemu", "lxc", "tasks")
+        else:
+            paths.append("/status/datastore-usage")
+            subs = ("status", "tasks")
+        if self.node:
+            paths += [f"/nodes/{self.node}/{sub}" for sub in subs]
+
+        base_url = self.api.base_url
+        self._endpoints = {path: URL(f"{base_url}{path}") for path in paths}
+
+    async def _get(self, path: str, *, params: dict[str, Any] | None = None) -> Any:
+        return await self.api.get(path, params=params, url=self._endpoints.get(path))
+
     async def _safe_get(self, path: str, *, params: dict[str, Any] | None = None, default: Any = None) -> Any:
         try:
-            return await self.api.get(path, params=params)
+            return await self._get(path, params=params)
         except ProxmoxApiError as e:
             _LOGGER.debug("API call failed (%s): %s", path, e)
             return default
 
+    async def _async_get_version(self) -> Any:
+        if time.monotonic() < self._version_expires:
+            return self._version_cache
+
+        version = await self._safe_get("/version", default=None)
+        if version is not None:
+            self._version_cache = version
+            self._version_expires = time.monotonic() + VERSION_CACHE_SECONDS
+        return self._version_cache
+
+    def _tasks_since(self) -> int | None:
+        """Start time to fetch tasks from: oldest still-running task, else newest known task."""
+        running = [t.get("starttime") or 0 for t in self._tasks.values() if task_is_running(t)]
+        if running:
+            return min(running)
+        if self._tasks:
+            return max(t.get("starttime") or 0 for t in self._tasks.values())
+        return None
+
+    async def _async_get_tasks(self, path: str) -> list[dict[str, Any]]:
+        """Fetch only tasks started since the last poll and merge them into the history.
+
+        "since" filters on starttime, so it is held back to the oldest running task;
+        otherwise that task's completion would never be seen. Raises ProxmoxApiError
+        and keeps the history untouched if the request fails; an unexpected payload
+        returns the current history.
+        """
+        params: dict[str, Any] = {"limit": _TASK_HISTORY}
+        since = self._tasks_since()
+        if since is not None:
+            params["since"] = since
+
+        new_tasks = await self._get(path, params=params)
+        if isinstance(new_tasks, list):
+            for t in new_tasks:
+                if isinstance(t, dict) and t.get("upid"):
+                    self._tasks[t["upid"]] = _slim_task(t)
+
+        newest = sorted(self._tasks.values(), key=lambda t: t.get("starttime") or 0, reverse=True)[:_TASK_HISTORY]
+        self._tasks = {t["upid"]: t for t in newest}
+        return newest
+
     @staticmethod
     def _extract_hostname_from_status(status: Any) -> str | None:
         """Try to extract a nice hostname/nodename from a PBS status payload."""
@@ -92,85 +267,128 @@ class ProxmoxCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Enforce no-IP display naming."""
         if self.backend == BACKEND_PVE:
             # For PVE: prefer node
-            self.display_name = (pve_node or self.node or "PVE").strip()
-            return
+            display = (pve_node or self.node or "PVE").strip()
+        else:
+            # For PBS: prefer real hostname, fallback to PBS (never host/ip)
+            hn = (pbs_hostname or "").strip()
+            display = hn if hn else "PBS"
+
+        self.display_name = display
+
+    def _build_updater(self) -> Callable[[], Awaitable[dict[str, Any]]]:
+        """Bind the backend-specific update function (backend/node are fixed after setup)."""
+        if self.backend == BACKEND_PBS:
+            return self._build_pbs_updater()
+        if not self.node:
+            return self._async_resolve_pve_node
+        return self._build_pve_updater()
+
+    async def _async_resolve_pve_node(self) -> dict[str, Any]:
+        nodes = await self._safe_get("/nodes", default=[])
+        self.node = (nodes[0].get("node") if nodes else "") or ""
+        if not self.node:
+            raise UpdateFailed("Could not determine PVE node name")
+
+        self._build_endpoints()
+        self._do_update = self._build_pve_updater()
+        return await self._do_update()
+
+    def _build_pve_updater(self) -> Callable[[], Awaitable[dict[str, Any]]]:
+        node = self.node
+        status_path = f"/nodes/{node}/status"
+        qemu_path = f"/nodes/{node}/qemu"
+        lxc_path = f"/nodes/{node}/lxc"
+        tasks_path = f"/nodes/{node}/tasks"
+        tasks_params = {"running": "true", "limit": 200}
+        safe_get = self._safe_get
+        get_version = self._async_get_version
+
+        self._set_display_name_no_ip(pve_node=node)
+
+        def count(guests: Any) -> tuple[int, int]:
+            """Return (total, running); bool sum avoids a per-item generator yield."""
+            if not isinstance(guests, list):
+                return 0, 0
+            return len(guests), sum([g.get("status") == "running" for g in guests])
+
+        async def update() -> dict[str, Any]:
+            # Independent requests -> run concurrently (_safe_get never raises ProxmoxApiError)
+            version, status, vms, lxcs, tasks_running = await asyncio.gather(
+                get_version(),
+                safe_get(status_path, default={}),
+                safe_get(qemu_path, default=[]),
+                safe_get(lxc_path, default=[]),
+                safe_get(tasks_path, params=tasks_params, default=[]),
+            )
 
-        # For PBS: prefer real hostname, fallback to PBS (never host/ip)
-        hn = (pbs_hostname or "").strip()
-        self.display_name = hn if hn else "PBS"
+            if isinstance(tasks_running, list):
+                tasks_running = [_slim_task(t) for t in tasks_running if isinstance(t, dict)]
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        try:
-            version = await self._safe_get("/version", default=None)
-
-            if self.backend == BACKEND_PVE:
-                if not self.node:
-                    nodes = await self._safe_get("/nodes", default=[])
-                    self.node = (nodes[0].get("node") if nodes else "") or ""
-                if not self.node:
-                    raise UpdateFailed("Could not determine PVE node name")
-
-                status = await self._safe_get(f"/nodes/{self.node}/status", default={})
-
-                vms_total = vms_running = 0
-                lxcs_total = lxcs_running = 0
-
-                vms = await self._safe_get(f"/nodes/{self.node}/qemu", default=[])
-                if isinstance(vms, list):
-                    vms_total = len(vms)
-                    vms_running = sum(1 for vm in vms if vm.get("status") == "running")
-
-                lxcs = await self._safe_get(f"/nodes/{self.node}/lxc", default=[])
-                if isinstance(lxcs, list):
-                    lxcs_total = len(lxcs)
-                    lxcs_running = sum(1 for ct in lxcs if ct.get("status") == "running")
-
-                tasks_running = await self._safe_get(
-                    f"/nodes/{self.node}/tasks",
-                    params={"running": "true", "limit": 200},
-                    default=[],
-                )
-
-                self._set_display_name_no_ip(pve_node=self.node)
-
-                return {
-                    "backend": BACKEND_PVE,
-                    "node": self.node,
-                    "display_name": self.display_name,
-                    "version": version,
-                    "status": status or {},
-                    "counts": {
-                        "vms_total": vms_total,
-                        "vms_running": vms_running,
-                        "lxcs_total": lxcs_total,
-                        "lxcs_running": lxcs_running,
-                    },
-                    "tasks_running": tasks_running or [],
-                }
-
-            # ======================
-            # PBS
-            # ======================
-            node = self.node or "localhost"
-
-            status = await self._safe_get(f"/nodes/{node}/status", default={})
-            datastores = await self._safe_get("/status/datastore-usage", default=[])
-
-            tasks_all = await self._safe_get(
-                f"/nodes/{node}/tasks",
-                params={"limit": 200},
-                default=[],
-            )
+            vms_total, vms_running = count(vms)
+            lxcs_total, lxcs_running = count(lxcs)
 
-            tasks_running = await self._safe_get(
-                f"/nodes/{node}/tasks",
-                params={"running": "true", "limit": 200},
-                default=[],
+            return {
+                "backend": BACKEND_PVE,
+                "node": node,
+                "display_name": self.display_name,
+                "version": version,
+                "status": status or {},
+                "counts": {
+                    "vms_total": vms_total,
+                    "vms_running": vms_running,
+                    "lxcs_total": lxcs_total,
+                    "lxcs_running": lxcs_running,
+                },
+                "tasks_running": tasks_running or [],
+            }
+
+        return update
+
+    def _build_pbs_updater(self) -> Callable[[], Awaitable[dict[str, Any]]]:
+        node = self.node or "localhost"
+        status_path = f"/nodes/{node}/status"
+        datastores_path = "/status/datastore-usage"
+        tasks_path = f"/nodes/{node}/tasks"
+        get = self._get
+        get_version = self._async_get_version
+        get_tasks = self._async_get_tasks
+        paths = (status_path, datastores_path, tasks_path)
+        defaults: tuple[Any, ...] = ({}, [], [])
+
+        async def update() -> dict[str, Any]:
+            # Exceptions are returned, not raised, so the real cause can be reported
+            version, *results = await asyncio.gather(
+                get_version(),
+                get(status_path),
+                get(datastores_path),
+                get_tasks(tasks_path),
+                return_exceptions=True,
             )
 
-            if not status and not datastores and not tasks_all and not tasks_running:
+            # Only API failures fall back to defaults; anything else is a bug -> UpdateFailed
+            for r in (version, *results):
+                if isinstance(r, Exception) and not isinstance(r, ProxmoxApiError):
+                    raise r
+
+            if all(isinstance(r, ProxmoxApiError) or not r for r in results):
+                error = next((r for r in results if isinstance(r, ProxmoxApiError)), None)
+                if error is not None:
+                    raise UpdateFailed(f"PBS unreachable: {error!r}")
                 raise UpdateFailed("PBS: all API calls failed (no data returned)")
 
+            for path, r in zip(paths, results):
+                if isinstance(r, ProxmoxApiError):
+                    _LOGGER.debug("API call failed (%s): %s", path, r)
+            status, datastores, tasks_all = (
+                default if isinstance(r, ProxmoxApiError) else r for r, default in zip(results, defaults)
+            )
+            if isinstance(results[2], ProxmoxApiError):
+                # Keep the history (sorted and trimmed) instead of dropping the task sensors to 0
+                tasks_all = list(self._tasks.values())
+
+            # Running tasks are a subset of the task list -> no second request
+            tasks_running = [t for t in tasks_all if task_is_running(t)]
+
             hostname = self._extract_hostname_from_status(status)
             self._set_display_name_no_ip(pbs_hostname=hostname)
 
@@ -185,7 +403,36 @@ class ProxmoxCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 "tasks_running": tasks_running or [],
             }
 
+        return update
+
+    def _adapt_update_interval(self, data: dict[str, Any]) -> None:
+        """Poll slower while guests/tasks/usage do not change, snap back to the base interval on change."""
+        tasks = data.get("tasks") or ()
+        fingerprint = (
+            tuple((data.get("counts") or {}).values()),
+            len(data.get("tasks_running") or ()),
+            tasks[0].get("upid") if tasks else None,
+            _usage_fingerprint(data),
+        )
+
+        if fingerprint != self._fingerprint:
+            self._fingerprint = fingerprint
+            self._stable_cycles = 0
+            self.update_interval = timedelta(seconds=UPDATE_INTERVAL_SECONDS)
+            return
+
+        self._stable_cycles += 1
+        if self._stable_cycles >= STABLE_CYCLES_BEFORE_BACKOFF:
+            self._stable_cycles = 0
+            seconds = self.update_interval.total_seconds() if self.update_interval else UPDATE_INTERVAL_SECONDS
+            self.update_interval = timedelta(seconds=min(UPDATE_INTERVAL_MAX_SECONDS, seconds * 2))
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        try:
+            data = await self._do_update()
+            self._adapt_update_interval(data)
+            return data
         except UpdateFailed:
             raise
         except Exception as e:
-            raise UpdateFailed(str(e)) from e
\ No newline at end of file
+            raise UpdateFailed(str(e)) from e
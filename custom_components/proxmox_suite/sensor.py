@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from dataclasses import dataclass
+from functools import lru_cache
+from time import time as _time
 from typing import Any, Callable, Optional
 
 from homeassistant.components.sensor import (
@@ -10,61 +12,52 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTime, PERCENTAGE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, BACKEND_PVE, BACKEND_PBS
-from .coordinator import ProxmoxCoordinator
+from .coordinator import TASK_RUNNING_STATES, ProxmoxCoordinator, task_endtime
 
-# IEC GiB (base 1024)
+# IEC GiB (base 1024); multiply by the inverse instead of dividing
 _GIB = 1024 * 1024 * 1024
+_GIB_INV = 1.0 / _GIB
+_GIB_INV_X10 = 10.0 / _GIB
+
+# Shared read-only fallback; avoids allocating a fresh {} on lookups
+_EMPTY: dict[str, Any] = {}
 
 
 def _bytes_to_gib(v: Any, precision: int = 1) -> float | None:
+    # Fast path: JSON byte counts are plain non-negative int/float -> round half up to 0.1
+    t = type(v)
+    if (t is int or t is float) and precision == 1:
+        return int(v * _GIB_INV_X10 + 0.5) / 10.0
     if v is None:
         return None
     try:
         b = float(v)
-    except Exception:
+    except (TypeError, ValueError):
         return None
-    return round(b / _GIB, precision)
+    return round(b * _GIB_INV, precision)
 
 
-def _cpu_to_percent(v: Any) -> float | None:
-    if v is None:
+def _percent(used: Any, total: Any) -> float | None:
+    # JSON byte counts are already numbers: no float() coercion, one division
+    if not total or used is None:
         return None
     try:
-        f = float(v)
-    except Exception:
-        return None
-    # Proxmox usually returns 0..1 for CPU usage
-    if f <= 1.0:
-        return round(f * 100.0, 1)
-    return round(f, 1)
-
-
-def _percent(used: Any, total: Any) -> float | None:
+        if total < 0:
+            return None
+        return round(used * 100.0 / total, 2)
+    except TypeError:
+        pass
+    # Fallback for numeric strings
     try:
-        u = float(used)
         t = float(total)
-        if t <= 0:
-            return None
-        return round((u / t) * 100.0, 2)
-    except Exception:
-        return None
-
-
-def _mem_percent_from_status(status: dict[str, Any] | None) -> float | None:
-    """Compute memory usage % from Proxmox status dict (uses raw bytes)."""
-    if not isinstance(status, dict):
+        return round(float(used) * 100.0 / t, 2) if t > 0 else None
+    except (TypeError, ValueError):
         return None
-    mem = status.get("memory") or {}
-    if not isinstance(mem, dict):
-        return None
-    used = mem.get("used")
-    total = mem.get("total")
-    return _percent(used, total)
 
 
 def _load_1m(loadavg: Any) -> float | None:
@@ -79,101 +72,72 @@ def _load_1m(loadavg: Any) -> float | None:
     return None
 
 
-def _tasks_list(tasks: Any) -> list[dict[str, Any]]:
-    """Normalize tasks to a list of dicts; return empty list if unavailable."""
-    if not isinstance(tasks, list):
-        return []
-    out: list[dict[str, Any]] = []
-    for t in tasks:
-        if isinstance(t, dict):
-            out.append(t)
-    return out
-
-
-def _task_is_running(t: dict[str, Any]) -> bool:
-    st = (t.get("status") or t.get("state") or "").lower()
-    if st in ("running", "active"):
-        return True
-
-    endtime = t.get("endtime")
-    if endtime is None or endtime == "":
-        return True
-    try:
-        float(endtime)
-        return False
-    except Exception:
-        return True
+# Task status values (lower-case) meaning "finished successfully"
+_TASK_OK = frozenset(("ok", "success"))
 
 
-def _task_is_success(t: dict[str, Any]) -> bool:
-    st = (t.get("status") or t.get("state") or "").lower()
-    return st in ("ok", "success")
+@dataclass(slots=True, frozen=True)
+class _TaskScan:
+    running: int
+    failed_24h: int
+    attrs: dict[str, Any]
 
 
-def _task_endtime(t: dict[str, Any]) -> float | None:
-    endtime = t.get("endtime")
-    if endtime is None:
-        return None
-    try:
-        return float(endtime)
-    except Exception:
-        return None
-
+def _scan_tasks(tasks: Any, now: float) -> _TaskScan:
+    """Count running and failed (last 24h) tasks and collect debug samples in one pass.
 
-def _count_failed_tasks_last_24h(tasks: Any) -> int:
-    """Count tasks finished within last 24h with a non-success status."""
-    lst = _tasks_list(tasks)
-    if not lst:
-        return 0
+    Running uses the coordinator's task_is_running rule (status says so or no endtime). A finished
+    task counts as failed if it ended within 24h and neither status nor exitstatus is ok.
+    """
+    if not isinstance(tasks, list):
+        tasks = []
 
-    now = datetime.now(timezone.utc).timestamp()
     cutoff = now - 24 * 3600
+    task_running = TASK_RUNNING_STATES
+    task_ok = _TASK_OK
+    running = failed = count = 0
+    statuses: set[str] = set()
+    states: set[str] = set()
 
-    failed = 0
-    for t in lst:
-        end = _task_endtime(t)
-        if end is None or end < cutoff:
+    for t in tasks:
+        if not isinstance(t, dict):
             continue
-
-        if _task_is_running(t):
+        get = t.get
+
+        # Debug samples: first 50 tasks, at most 10 distinct values each
+        if count < 50:
+            if "status" in t and len(statuses) < 10:
+                statuses.add(str(get("status")))
+            if "state" in t and len(states) < 10:
+                states.add(str(get("state")))
+        count += 1
+
+        st = (get("status") or get("state") or "").lower()
+        if st in task_running:
+            running += 1
             continue
 
-        if _task_is_success(t):
+        end = task_endtime(t)
+        if end is None:
+            running += 1
             continue
 
-        exitstatus = (t.get("exitstatus") or "").lower()
-        if exitstatus in ("ok", "success"):
+        if end < cutoff or st in task_ok:
+            continue
+        if (get("exitstatus") or "").lower() in task_ok:
             continue
-
         failed += 1
 
-    return failed
-
-
-def _count_running_tasks(tasks: Any) -> int:
-    """Count tasks currently running."""
-    lst = _tasks_list(tasks)
-    if not lst:
-        return 0
-    return sum(1 for t in lst if _task_is_running(t))
-
-
-def _tasks_debug_attrs(tasks: Any) -> dict[str, Any]:
-    lst = _tasks_list(tasks)
-    statuses = []
-    states = []
-    for t in lst[:50]:
-        if isinstance(t, dict):
-            if "status" in t:
-                statuses.append(str(t.get("status")))
-            if "state" in t:
-                states.append(str(t.get("state")))
-    return {
-        "tasks_available": bool(lst),
-        "tasks_count": len(lst),
-        "sample_status_values": sorted(set(statuses))[:10],
-        "sample_state_values": sorted(set(states))[:10],
-    }
+    return _TaskScan(
+        running=running,
+        failed_24h=failed,
+        attrs={
+            "tasks_available": bool(count),
+            "tasks_count": count,
+            "sample_status_values": sorted(statuses),
+            "sample_state_values": sorted(states),
+        },
+    )
 
 
 def _format_uptime_de(seconds: Any) -> str | None:
@@ -186,10 +150,14 @@ def _format_uptime_de(seconds: Any) -> str | None:
         return None
     if s < 0:
         s = 0
+    # The text has minute resolution, so cache per whole minute
+    return _format_uptime_minutes(s // 60)
 
-    days, rem = divmod(s, 86400)
-    hours, rem = divmod(rem, 3600)
-    minutes, _ = divmod(rem, 60)
+
+@lru_cache(maxsize=1024)
+def _format_uptime_minutes(total_minutes: int) -> str:
+    days, rem = divmod(total_minutes, 1440)
+    hours, minutes = divmod(rem, 60)
 
     parts: list[str] = []
     if days:
@@ -202,27 +170,117 @@ def _format_uptime_de(seconds: Any) -> str | None:
     return " ".join(parts)
 
 
+# Datastore getters: shared module-level functions instead of one lambda per sensor
+def _ds_free_gib(ds: dict[str, Any]) -> float | None:
+    return _bytes_to_gib(ds.get("avail"))
+
+
+def _ds_used_gib(ds: dict[str, Any]) -> float | None:
+    return _bytes_to_gib(ds.get("used"))
+
+
+def _ds_total_gib(ds: dict[str, Any]) -> float | None:
+    return _bytes_to_gib(ds.get("total"))
+
+
+def _ds_usage_percent(ds: dict[str, Any]) -> float | None:
+    return _percent(ds.get("used"), ds.get("total"))
+
+
+def _build_derived(data: dict[str, Any] | None) -> dict[str, Any]:
+    """Compute the node-level sensor values once per coordinator update.
+
+    Uses plain subscripts with KeyError/TypeError fallbacks instead of ``.get() or {}`` chains.
+    """
+    if data is None:
+        return {}
+    status = data.get("status")
+
+    try:
+        cpu = float(status["cpu"])
+        # Proxmox usually returns 0..1 for CPU usage
+        cpu_percent = round(cpu * 100.0, 1) if cpu <= 1.0 else round(cpu, 1)
+    except (KeyError, TypeError, ValueError):
+        cpu_percent = None
+
+    try:
+        mem_used = status["memory"]["used"]
+    except (KeyError, TypeError):
+        mem_used = None
+    try:
+        mem_total = status["memory"]["total"]
+    except (KeyError, TypeError):
+        mem_total = None
+    try:
+        loadavg = status["loadavg"]
+    except (KeyError, TypeError):
+        loadavg = None
+    try:
+        uptime = status["uptime"]
+    except (KeyError, TypeError):
+        uptime = None
+
+    counts = data.get("counts") or _EMPTY
+    derived = {
+        "cpu_percent": cpu_percent,
+        "mem_percent": _percent(mem_used, mem_total),
+        "mem_used_gib": _bytes_to_gib(mem_used),
+        "mem_total_gib": _bytes_to_gib(mem_total),
+        "load_1m": _load_1m(loadavg),
+        "uptime": uptime,
+        "uptime_lesbar": _format_uptime_de(uptime),
+        "vms_running": counts.get("vms_running"),
+        "vms_total": counts.get("vms_total"),
+        "lxcs_running": counts.get("lxcs_running"),
+        "lxcs_total": counts.get("lxcs_total"),
+    }
+
+    if data.get("backend") == BACKEND_PBS:
+        now = _time()
+        running = _scan_tasks(data.get("tasks_running"), now)
+        recent = _scan_tasks(data.get("tasks"), now)
+        derived["running_tasks"] = running.running
+        derived["running_tasks_attrs"] = running.attrs
+        derived["failed_tasks_24h"] = recent.failed_24h
+        derived["failed_tasks_24h_attrs"] = recent.attrs
+        derived["datastores_by_store"] = {
+            ds["store"]: ds
+            for ds in data.get("datastores") or ()
+            if isinstance(ds, dict) and ds.get("store")
+        }
+
+    return derived
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:
     coord: ProxmoxCoordinator = hass.data[DOMAIN][entry.entry_id]
     entities: list[SensorEntity] = []
 
-    # Device display name should be provided by coordinator (no IP).
-    display = getattr(coord, "display_name", None) or coord.node or "PBS"
+    # Registered before the entities, so sensors always read values of the current update
+    @callback
+    def _async_update_derived() -> None:
+        coord.derived = _build_derived(coord.data)
 
+    _async_update_derived()
+    entry.async_on_unload(coord.async_add_listener(_async_update_derived))
+
+    # Shared unique_id prefix "<entry_id>:<backend>:" (datastore sensors only exist for pbs)
+    uid_prefix = f"{entry.entry_id}:{coord.backend}:"
+
+    # One DeviceInfo shared by all sensors; name is provided by coordinator (no IP).
     device_info = DeviceInfo(
-        identifiers={(DOMAIN, coord.device_identifier)},
-        name=f"Proxmox {coord.backend.upper()} ({display})",
+        identifiers=coord.device_identifiers,
+        name=coord.device_name,
         manufacturer="Proxmox",
-        model="Proxmox VE" if coord.backend == BACKEND_PVE else "Proxmox Backup Server",
+        model=coord.model_name,
     )
 
     if coord.backend == BACKEND_PVE:
         entities += [
             ProxmoxValueSensor(
-                coord, entry,
+                coord, uid_prefix,
                 name="CPU Usage",
                 key="cpu_percent",
-                getter=lambda d: _cpu_to_percent((d.get("status") or {}).get("cpu")),
                 unit=PERCENTAGE,
                 device_class=None,
                 state_class=SensorStateClass.MEASUREMENT,
@@ -230,10 +288,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
                 device_info=device_info,
             ),
             ProxmoxValueSensor(
-                coord, entry,
+                coord, uid_prefix,
                 name="Memory Usage",
                 key="mem_percent",
-                getter=lambda d: _mem_percent_from_status(d.get("status")),
                 unit=PERCENTAGE,
                 device_class=None,
                 state_class=SensorStateClass.MEASUREMENT,
@@ -242,10 +299,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
             ),
             # ✅ Name without "(GiB)"
             ProxmoxValueSensor(
-                coord, entry,
+                coord, uid_prefix,
                 name="Memory Used",
                 key="mem_used_gib",
-                getter=lambda d: _bytes_to_gib(((d.get("status") or {}).get("memory") or {}).get("used")),
                 unit="GiB",
                 device_class=None,
                 state_class=SensorStateClass.MEASUREMENT,
@@ -254,10 +310,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
             ),
             # ✅ Name without "(GiB)"
             ProxmoxValueSensor(
-                coord, entry,
+                coord, uid_prefix,
                 name="Memory Total",
                 key="mem_total_gib",
-                getter=lambda d: _bytes_to_gib(((d.get("status") or {}).get("memory") or {}).get("total")),
                 unit="GiB",
                 device_class=None,
                 state_class=SensorStateClass.MEASUREMENT,
@@ -265,10 +320,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
                 device_info=device_info,
             ),
             ProxmoxValueSensor(
-                coord, entry,
+                coord, uid_prefix,
                 name="Load (1m)",
                 key="load_1m",
-                getter=lambda d: _load_1m((d.get("status") or {}).get("loadavg")),
                 unit=None,
                 device_class=None,
                 state_class=SensorStateClass.MEASUREMENT,
@@ -276,10 +330,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
                 device_info=device_info,
             ),
             ProxmoxValueSensor(
-                coord, entry,
+                coord, uid_prefix,
                 name="Uptime",
                 key="uptime",
-                getter=lambda d: (d.get("status") or {}).get("uptime"),
                 unit=UnitOfTime.SECONDS,
                 device_class=SensorDeviceClass.DURATION,
                 state_class=SensorStateClass.TOTAL_INCREASING,
@@ -287,18 +340,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
                 device_info=device_info,
             ),
             ProxmoxTextSensor(
-                coord, entry,
+                coord, uid_prefix,
                 name="Uptime (lesbar)",
                 key="uptime_lesbar",
-                getter=lambda d: _format_uptime_de((d.get("status") or {}).get("uptime")),
                 icon="mdi:clock-outline",
                 device_info=device_info,
             ),
             ProxmoxValueSensor(
-                coord, entry,
+                coord, uid_prefix,
                 name="VMs Running",
                 key="vms_running",
-                getter=lambda d: (d.get("counts") or {}).get("vms_running"),
                 unit=None,
                 device_class=None,
                 state_class=None,
@@ -306,10 +357,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
                 device_info=device_info,
             ),
             ProxmoxValueSensor(
-                coord, entry,
+                coord, uid_prefix,
                 name="VMs Total",
                 key="vms_total",
-                getter=lambda d: (d.get("counts") or {}).get("vms_total"),
                 unit=None,
                 device_class=None,
                 state_class=None,
@@ -317,10 +367,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
                 device_info=device_info,
             ),
             ProxmoxValueSensor(
-                coord, entry,
+                coord, uid_prefix,
                 name="LXCs Running",
                 key="lxcs_running",
-                getter=lambda d: (d.get("counts") or {}).get("lxcs_running"),
                 unit=None,
                 device_class=None,
                 state_class=None,
@@ -328,10 +377,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
                 device_info=device_info,
             ),
             ProxmoxValueSensor(
-                coord, entry,
+                coord, uid_prefix,
                 name="LXCs Total",
                 key="lxcs_total",
-                getter=lambda d: (d.get("counts") or {}).get("lxcs_total"),
                 unit=None,
                 device_class=None,
                 state_class=None,
@@ -343,10 +391,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     if coord.backend == BACKEND_PBS:
         entities += [
             ProxmoxValueSensor(
-                coord, entry,
+                coord, uid_prefix,
                 name="CPU Usage",
                 key="cpu_percent",
-                getter=lambda d: _cpu_to_percent((d.get("status") or {}).get("cpu")),
                 unit=PERCENTAGE,
                 device_class=None,
                 state_class=SensorStateClass.MEASUREMENT,
@@ -355,10 +402,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
             ),
             # ✅ Name without "(GiB)"
             ProxmoxValueSensor(
-                coord, entry,
+                coord, uid_prefix,
                 name="Memory Used",
                 key="mem_used_gib",
-                getter=lambda d: _bytes_to_gib(((d.get("status") or {}).get("memory") or {}).get("used")),
                 unit="GiB",
                 device_class=None,
                 state_class=SensorStateClass.MEASUREMENT,
@@ -367,10 +413,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
             ),
             # ✅ Name without "(GiB)"
             ProxmoxValueSensor(
-                coord, entry,
+                coord, uid_prefix,
                 name="Memory Total",
                 key="mem_total_gib",
-                getter=lambda d: _bytes_to_gib(((d.get("status") or {}).get("memory") or {}).get("total")),
                 unit="GiB",
                 device_class=None,
                 state_class=SensorStateClass.MEASUREMENT,
@@ -378,10 +423,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
                 device_info=device_info,
             ),
             ProxmoxValueSensor(
-                coord, entry,
+                coord, uid_prefix,
                 name="Uptime",
                 key="uptime",
-                getter=lambda d: (d.get("status") or {}).get("uptime"),
                 unit=UnitOfTime.SECONDS,
                 device_class=SensorDeviceClass.DURATION,
                 state_class=SensorStateClass.TOTAL_INCREASING,
@@ -389,47 +433,39 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
                 device_info=device_info,
             ),
             ProxmoxTextSensor(
-                coord, entry,
+                coord, uid_prefix,
                 name="Uptime (lesbar)",
                 key="uptime_lesbar",
-                getter=lambda d: _format_uptime_de((d.get("status") or {}).get("uptime")),
                 icon="mdi:clock-outline",
                 device_info=device_info,
             ),
             ProxmoxTaskSensor(
-                coord, entry,
+                coord, uid_prefix,
                 name="Running Tasks",
                 key="running_tasks",
-                getter=lambda d: _count_running_tasks(d.get("tasks_running")),
                 icon="mdi:progress-clock",
                 device_info=device_info,
-                attrs_getter=lambda d: _tasks_debug_attrs(d.get("tasks_running")),
             ),
             ProxmoxTaskSensor(
-                coord, entry,
+                coord, uid_prefix,
                 name="Failed Tasks (24h)",
                 key="failed_tasks_24h",
-                getter=lambda d: _count_failed_tasks_last_24h(d.get("tasks")),
                 icon="mdi:alert-circle-outline",
                 device_info=device_info,
-                attrs_getter=lambda d: _tasks_debug_attrs(d.get("tasks")),
             ),
         ]
 
-        for ds in (coord.data or {}).get("datastores", []) or []:
-            store = ds.get("store")
-            if not store:
-                continue
-
+        # The derived index already skips datastores without a name
+        for store in coord.derived.get("datastores_by_store", _EMPTY):
             prefix = f"Datastore {store}"
 
             entities += [
                 # ✅ Name without "(GiB)"
                 DatastoreValueSensor(
-                    coord, entry, store=store,
+                    coord, uid_prefix, store=store,
                     name=f"{prefix} Free",
                     key=f"ds:{store}:free_gib",
-                    getter=lambda x: _bytes_to_gib(x.get("avail")),
+                    getter=_ds_free_gib,
                     unit="GiB",
                     device_class=None,
                     state_class=SensorStateClass.MEASUREMENT,
@@ -437,10 +473,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
                 ),
                 # ✅ Name without "(GiB)"
                 DatastoreValueSensor(
-                    coord, entry, store=store,
+                    coord, uid_prefix, store=store,
                     name=f"{prefix} Used",
                     key=f"ds:{store}:used_gib",
-                    getter=lambda x: _bytes_to_gib(x.get("used")),
+                    getter=_ds_used_gib,
                     unit="GiB",
                     device_class=None,
                     state_class=SensorStateClass.MEASUREMENT,
@@ -448,20 +484,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
                 ),
                 # ✅ Name without "(GiB)"
                 DatastoreValueSensor(
-                    coord, entry, store=store,
+                    coord, uid_prefix, store=store,
                     name=f"{prefix} Total",
                     key=f"ds:{store}:total_gib",
-                    getter=lambda x: _bytes_to_gib(x.get("total")),
+                    getter=_ds_total_gib,
                     unit="GiB",
                     device_class=None,
                     state_class=SensorStateClass.MEASUREMENT,
                     device_info=device_info,
                 ),
                 DatastoreValueSensor(
-                    coord, entry, store=store,
+                    coord, uid_prefix, store=store,
                     name=f"{prefix} Usage",
                     key=f"ds:{store}:usage_percent",
-                    getter=lambda x: _percent(x.get("used"), x.get("total")),
+                    getter=_ds_usage_percent,
                     unit=PERCENTAGE,
                     device_class=None,
                     state_class=SensorStateClass.MEASUREMENT,
@@ -473,15 +509,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 
 
 class ProxmoxValueSensor(CoordinatorEntity[ProxmoxCoordinator], SensorEntity):
+    __slots__ = ("_key",)
     _attr_has_entity_name = True
 
     def __init__(
         self,
         coordinator: ProxmoxCoordinator,
-        entry: ConfigEntry,
+        uid_prefix: str,
         name: str,
         key: str,
-        getter: Callable[[dict[str, Any]], Any],
         unit: Optional[str],
         device_class: Optional[SensorDeviceClass],
         state_class: Optional[SensorStateClass],
@@ -489,10 +525,9 @@ class ProxmoxValueSensor(CoordinatorEntity[ProxmoxCoordinator], SensorEntity):
         device_info: DeviceInfo,
     ) -> None:
         super().__init__(coordinator)
-        self.entry = entry
         self._attr_name = name
-        self._attr_unique_id = f"{entry.entry_id}:{coordinator.backend}:{key}"
-        self._getter = getter
+        self._attr_unique_id = uid_prefix + key
+        self._key = key
 
         self._attr_native_unit_of_measurement = unit
         self._attr_device_class = device_class
@@ -504,28 +539,27 @@ class ProxmoxValueSensor(CoordinatorEntity[ProxmoxCoordinator], SensorEntity):
 
     @property
     def native_value(self) -> Any:
-        return self._getter(self.coordinator.data or {})
+        return self.coordinator.derived.get(self._key)
 
 
 class ProxmoxTextSensor(CoordinatorEntity[ProxmoxCoordinator], SensorEntity):
     """A sensor that returns a human-readable string (no unit/device_class)."""
+    __slots__ = ("_key",)
     _attr_has_entity_name = True
 
     def __init__(
         self,
         coordinator: ProxmoxCoordinator,
-        entry: ConfigEntry,
+        uid_prefix: str,
         name: str,
         key: str,
-        getter: Callable[[dict[str, Any]], str | None],
         icon: Optional[str],
         device_info: DeviceInfo,
     ) -> None:
         super().__init__(coordinator)
-        self.entry = entry
         self._attr_name = name
-        self._attr_unique_id = f"{entry.entry_id}:{coordinator.backend}:{key}"
-        self._getter = getter
+        self._attr_unique_id = uid_prefix + key
+        self._key = key
 
         self._attr_native_unit_of_measurement = None
         self._attr_device_class = None
@@ -537,29 +571,28 @@ class ProxmoxTextSensor(CoordinatorEntity[ProxmoxCoordinator], SensorEntity):
 
     @property
     def native_value(self) -> str | None:
-        return self._getter(self.coordinator.data or {})
+        return self.coordinator.derived.get(self._key)
 
 
 class ProxmoxTaskSensor(CoordinatorEntity[ProxmoxCoordinator], SensorEntity):
+    """Task count from the derived view; debug attributes are stored under '<key>_attrs'."""
+    __slots__ = ("_key", "_attrs_key")
     _attr_has_entity_name = True
 
     def __init__(
         self,
         coordinator: ProxmoxCoordinator,
-        entry: ConfigEntry,
+        uid_prefix: str,
         name: str,
         key: str,
-        getter: Callable[[dict[str, Any]], int],
         icon: Optional[str],
         device_info: DeviceInfo,
-        attrs_getter: Callable[[dict[str, Any]], dict[str, Any]],
     ) -> None:
         super().__init__(coordinator)
-        self.entry = entry
         self._attr_name = name
-        self._attr_unique_id = f"{entry.entry_id}:{coordinator.backend}:{key}"
-        self._getter = getter
-        self._attrs_getter = attrs_getter
+        self._attr_unique_id = uid_prefix + key
+        self._key = key
+        self._attrs_key = f"{key}_attrs"
 
         self._attr_native_unit_of_measurement = None
         self._attr_device_class = None
@@ -571,21 +604,22 @@ class ProxmoxTaskSensor(CoordinatorEntity[ProxmoxCoordinator], SensorEntity):
 
     @property
     def native_value(self) -> int:
-        val = self._getter(self.coordinator.data or {})
+        val = self.coordinator.derived.get(self._key)
         return int(val) if val is not None else 0
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        return self._attrs_getter(self.coordinator.data or {})
+        return self.coordinator.derived.get(self._attrs_key, _EMPTY)
 
 
 class DatastoreValueSensor(CoordinatorEntity[ProxmoxCoordinator], SensorEntity):
+    __slots__ = ("store", "_getter")
     _attr_has_entity_name = True
 
     def __init__(
         self,
         coordinator: ProxmoxCoordinator,
-        entry: ConfigEntry,
+        uid_prefix: str,
         store: str,
         name: str,
         key: str,
@@ -596,10 +630,9 @@ class DatastoreValueSensor(CoordinatorEntity[ProxmoxCoordinator], SensorEntity):
         device_info: DeviceInfo,
     ) -> None:
         super().__init__(coordinator)
-        self.entry = entry
         self.store = store
         self._attr_name = name
-        self._attr_unique_id = f"{entry.entry_id}:pbs:{key}"
+        self._attr_unique_id = uid_prefix + key
         self._getter = getter
 
         self._attr_native_unit_of_measurement = unit
@@ -609,7 +642,8 @@ class DatastoreValueSensor(CoordinatorEntity[ProxmoxCoordinator], SensorEntity):
 
     @property
     def native_value(self) -> Any:
-        for ds in (self.coordinator.data or {}).get("datastores", []) or []:
-            if ds.get("store") == self.store:
-                return self._getter(ds)
-        return None
\ No newline at end of file
+        try:
+            ds = self.coordinator.derived["datastores_by_store"][self.store]
+        except KeyError:
+            return None
+        return self._getter(ds)
\ No newline at end of file